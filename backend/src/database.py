@@ -21,6 +21,7 @@ except ImportError:
     # Fallback for when running as script
     from models import Base, Artifact, ArtifactFile, ArtifactEvent, DeletedDocument
 import os
+from datetime import datetime
 from typing import Optional, List
 import uuid
 import logging
@@ -832,38 +833,92 @@ class Database:
             logger.error(f"Database error retrieving children for parent {parent_id}: {e}")
             raise
 
-    def get_artifact_events(self, artifact_id: str) -> List[ArtifactEvent]:
+    def get_artifact_events(self, artifact_id: str,
+                            start_time: Optional[datetime] = None,
+                            end_time: Optional[datetime] = None) -> List[ArtifactEvent]:
         """
         Get all events for a specific artifact, ordered by creation date.
-        
+
         Args:
             artifact_id: The ID of the artifact
-        
+            start_time: Optional inclusive lower bound on created_at
+            end_time: Optional inclusive upper bound on created_at
+
         Returns:
             List[ArtifactEvent]: List of events for the artifact, ordered by creation date
-        
+
         Raises:
             ValueError: If artifact_id is empty
             SQLAlchemyError: If database operation fails
         """
         if not artifact_id:
             raise ValueError("artifact_id is required")
-        
+
         try:
             session = self._ensure_session()
-            
-            events = session.query(ArtifactEvent)\
-                .filter(ArtifactEvent.artifact_id == artifact_id)\
-                .order_by(ArtifactEvent.created_at.asc())\
-                .all()
-            
+
+            # Range predicates run in SQL so excluded rows never cross the
+            # wire; callers no longer post-filter in Python
+            query = session.query(ArtifactEvent)\
+                .filter(ArtifactEvent.artifact_id == artifact_id)
+            if start_time is not None:
+                query = query.filter(ArtifactEvent.created_at >= start_time)
+            if end_time is not None:
+                query = query.filter(ArtifactEvent.created_at <= end_time)
+
+            events = query.order_by(ArtifactEvent.created_at.asc()).all()
+
             logger.debug(f"Retrieved {len(events)} events for artifact {artifact_id}")
             return events
-            
+
         except SQLAlchemyError as e:
             logger.error(f"Database error retrieving events for artifact {artifact_id}: {e}")
             raise
     
+    def iter_artifact_events(self, artifact_id: str,
+                             start_time: Optional[datetime] = None,
+                             end_time: Optional[datetime] = None,
+                             batch_size: int = 1000):
+        """
+        Stream events for a specific artifact in creation order.
+
+        Rows are fetched in batches of ``batch_size`` so large histories are
+        never fully materialized on the Python side, and the optional time
+        bounds are applied in SQL rather than post-filtered by the caller.
+
+        Args:
+            artifact_id: The ID of the artifact
+            start_time: Optional inclusive lower bound on created_at
+            end_time: Optional inclusive upper bound on created_at
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            ArtifactEvent: Events for the artifact, ordered by creation date
+
+        Raises:
+            ValueError: If artifact_id is empty
+            SQLAlchemyError: If database operation fails
+        """
+        if not artifact_id:
+            raise ValueError("artifact_id is required")
+
+        try:
+            session = self._ensure_session()
+
+            query = session.query(ArtifactEvent)\
+                .filter(ArtifactEvent.artifact_id == artifact_id)
+            if start_time is not None:
+                query = query.filter(ArtifactEvent.created_at >= start_time)
+            if end_time is not None:
+                query = query.filter(ArtifactEvent.created_at <= end_time)
+
+            yield from query.order_by(ArtifactEvent.created_at.asc())\
+                .yield_per(batch_size)
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error streaming events for artifact {artifact_id}: {e}")
+            raise
+
     def close(self):
         """Close the current database session."""
         if self.session:
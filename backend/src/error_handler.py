@@ -14,12 +14,24 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import time
 
+try:
+    # orjson serializes error payloads several times faster than the
+    # stdlib encoder behind the default JSONResponse
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as ErrorJSONResponse
+except ImportError:
+    ErrorJSONResponse = JSONResponse
+
 logger = logging.getLogger(__name__)
 
 
 class IntegrityXError(Exception):
     """Base exception for IntegrityX application errors."""
-    
+
+    # These exceptions are raised on every failed request; slots keep the
+    # per-instance attribute storage compact and fast.
+    __slots__ = ('message', 'error_code', 'details')
+
     def __init__(self, message: str, error_code: str = None, details: Dict[str, Any] = None):
         self.message = message
         self.error_code = error_code or "INTEGRITY_ERROR"
@@ -29,7 +41,9 @@ class IntegrityXError(Exception):
 
 class ValidationError(IntegrityXError):
     """Validation error for input data."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, field: str = None, value: Any = None):
         super().__init__(
             message=message,
@@ -40,7 +54,9 @@ class ValidationError(IntegrityXError):
 
 class SecurityError(IntegrityXError):
     """Security-related error."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, security_level: str = "medium"):
         super().__init__(
             message=message,
@@ -51,7 +67,9 @@ class SecurityError(IntegrityXError):
 
 class BlockchainError(IntegrityXError):
     """Blockchain operation error."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, operation: str = None, tx_id: str = None):
         super().__init__(
             message=message,
@@ -62,7 +80,9 @@ class BlockchainError(IntegrityXError):
 
 class DatabaseError(IntegrityXError):
     """Database operation error."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, operation: str = None, table: str = None):
         super().__init__(
             message=message,
@@ -110,7 +130,7 @@ class ErrorHandler:
         
         logger.warning(f"Validation error: {error_details}")
         
-        return JSONResponse(
+        return ErrorJSONResponse(
             status_code=422,
             content={
                 "ok": False,
@@ -134,7 +154,7 @@ class ErrorHandler:
         """
         logger.warning(f"HTTP error {error.status_code}: {error.detail}")
         
-        return JSONResponse(
+        return ErrorJSONResponse(
             status_code=error.status_code,
             content={
                 "ok": False,
@@ -164,7 +184,7 @@ class ErrorHandler:
         else:
             logger.warning(f"Application error: {error.message}")
         
-        return JSONResponse(
+        return ErrorJSONResponse(
             status_code=status_code,
             content={
                 "ok": False,
@@ -187,20 +207,19 @@ class ErrorHandler:
         Returns:
             JSONResponse with generic error message
         """
-        # Log full error details
-        logger.error(f"Unexpected error: {str(error)}", exc_info=True)
-        
-        # Get request details if available
-        request_info = {}
+        # Log full error details. Request headers are deliberately not
+        # materialized: the old dict(request.headers) copy was never used
+        # and decoding every header on each 500 is wasted work.
         if request:
-            request_info = {
-                "method": request.method,
-                "url": str(request.url),
-                "headers": dict(request.headers)
-            }
-        
+            logger.error(
+                f"Unexpected error on {request.method} {request.url}: {str(error)}",
+                exc_info=True
+            )
+        else:
+            logger.error(f"Unexpected error: {str(error)}", exc_info=True)
+
         # Return generic error message (don't expose internal details)
-        return JSONResponse(
+        return ErrorJSONResponse(
             status_code=500,
             content={
                 "ok": False,
@@ -231,7 +250,7 @@ class ErrorHandler:
         Returns:
             JSONResponse with error details
         """
-        return JSONResponse(
+        return ErrorJSONResponse(
             status_code=status_code,
             content={
                 "ok": False,
@@ -9,9 +9,14 @@ This module provides graceful degradation and fallback mechanisms for:
 - Emergency mode operations
 """
 
+import collections
+import functools
+import itertools
 import logging
+import pickle
 import time
 import json
+import queue
 import threading
 from typing import Dict, Any, Optional, List, Callable, Union
 from dataclasses import dataclass
@@ -20,9 +25,96 @@ from enum import Enum
 import sqlite3
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps(obj: Any) -> str:
+    """Serialize a payload for storage: orjson when available, else
+    compact stdlib JSON (no cosmetic whitespace in stored rows)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            # orjson rejects some types the stdlib accepts (e.g. tuples)
+            pass
+    return json.dumps(obj, separators=(',', ':'))
+
+# Timestamp cache: formatting a datetime per stored operation showed up in
+# write-path profiles, and second granularity is all the retry buffer needs.
+_TIMESTAMP_CACHE = (0, '')
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time in ISO format, cached at one-second granularity."""
+    global _TIMESTAMP_CACHE
+    second = int(time.time())
+    if second != _TIMESTAMP_CACHE[0]:
+        _TIMESTAMP_CACHE = (
+            second,
+            datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+        )
+    return _TIMESTAMP_CACHE[1]
+
+
+# SQL hoisted to module scope: identical strings keep hitting sqlite3's
+# prepared-statement cache instead of being re-parsed per call. The artifact
+# upsert also replaces INSERT OR REPLACE, whose implicit DELETE+INSERT walks
+# the primary-key index twice even for brand-new rows.
+_SQL_INSERT_ARTIFACT = '''
+    INSERT INTO fallback_artifacts
+    (id, loan_id, artifact_type, etid, payload_sha256, walacor_tx_id,
+     created_by, created_at, data_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        loan_id = excluded.loan_id,
+        artifact_type = excluded.artifact_type,
+        etid = excluded.etid,
+        payload_sha256 = excluded.payload_sha256,
+        walacor_tx_id = excluded.walacor_tx_id,
+        created_by = excluded.created_by,
+        created_at = excluded.created_at,
+        data_json = excluded.data_json
+'''
+
+_SQL_INSERT_PENDING = '''
+    INSERT INTO pending_operations (operation_type, data_json, codec, created_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+
+def _encode_insert_artifact(args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Typed payload for insert_artifact: the artifact dict itself, which is
+    JSON data by construction — no reflection over raw call arguments."""
+    artifact = args[0] if args else kwargs.get('artifact_data', {})
+    return {'artifact_data': artifact}
+
+
+# Per-operation payload encoders. Operations without an entry fall back to
+# pickling the raw (args, kwargs), which round-trips arbitrary objects that
+# json.dumps would have silently dropped.
+_OP_CODECS: Dict[str, Callable[[tuple, dict], Dict[str, Any]]] = {
+    'insert_artifact': _encode_insert_artifact,
+}
+
+# One bit per tracked service. Status is kept in a single int so readers can
+# load it without a lock (int attribute reads are atomic in CPython); only
+# updates take fallback_lock, briefly.
+_SVC_BITS = {
+    'database': 1,
+    'walacor': 2,
+    'api': 4,
+}
+_ALL_SVC_BITS = sum(_SVC_BITS.values())
+
+
 class FallbackMode(Enum):
     """Fallback mode enumeration."""
     NORMAL = "normal"
@@ -30,6 +122,15 @@ class FallbackMode(Enum):
     EMERGENCY = "emergency"
     OFFLINE = "offline"
 
+# Modes ordered by severity; _mode_idx indexes into this and the per-mode
+# dispatch table so mode changes and dispatch are single array loads.
+_MODE_ORDER = (
+    FallbackMode.NORMAL,
+    FallbackMode.DEGRADED,
+    FallbackMode.EMERGENCY,
+    FallbackMode.OFFLINE,
+)
+
 @dataclass
 class FallbackConfig:
     """Fallback configuration."""
@@ -56,31 +157,85 @@ class GracefulFallbackService:
         """Initialize the fallback service."""
         self.config = config or FallbackConfig()
         self.current_mode = FallbackMode.NORMAL
+        self._mode_idx = 0
+        self._dispatch = (
+            self._execute_normal_operation,
+            self._execute_degraded_operation,
+            self._execute_emergency_operation,
+            self._execute_offline_operation,
+        )
         self.fallback_lock = threading.Lock()
+
+        # Fallback-id source: monotonic clock plus a process-local counter.
+        # int(time.time()) collided on bursts within the same second, and
+        # itertools.count() is atomic under the GIL so no lock is needed.
+        self._id_counter = itertools.count()
         
         # Local storage for fallback
         self.local_storage = None
-        self.pending_operations = []
+        # In-memory view of recently buffered operations: (name, monotonic).
+        # Bounded so a long outage can't grow it without limit; the SQLite
+        # table remains the durable record.
+        self.pending_operations = collections.deque(maxlen=10_000)
+
+        # All mutations go through a single writer thread: concurrent
+        # writers on one SQLite handle otherwise trip SQLITE_BUSY under load.
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # Stale-while-revalidate cache: last-known-good results recorded in
+        # normal mode, served instantly under degradation while a background
+        # refresh retries the real operation.
+        self._swr_cache: Dict[str, Any] = {}
+        self._swr_refreshing: set = set()
+        self._swr_lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='fallback-refresh'
+        )
         
-        # Service status tracking
-        self.service_status = {
-            'database': True,
-            'walacor': True,
-            'api': True
-        }
+        # Service status tracking: bitmap, all services up
+        self._status_bits = _ALL_SVC_BITS
         
         # Initialize local storage if enabled
         if self.config.enable_local_storage:
             self._initialize_local_storage()
-        
+
+        if self.local_storage is not None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                name="fallback-writer",
+                daemon=True
+            )
+            self._writer_thread.start()
+
         logger.info("Graceful fallback service initialized")
     
     def _initialize_local_storage(self) -> None:
         """Initialize local SQLite storage for fallback."""
         try:
             storage_path = os.path.join(tempfile.gettempdir(), self.config.local_storage_path)
-            self.local_storage = sqlite3.connect(storage_path, check_same_thread=False)
-            
+            fresh_db = not os.path.exists(storage_path)
+            self.local_storage = sqlite3.connect(
+                storage_path,
+                check_same_thread=False,
+                cached_statements=256
+            )
+
+            # WAL lets readers proceed during writes and turns most commits
+            # into sequential appends; synchronous=NORMAL skips the per-commit
+            # fsync while staying durable for everything short of power loss —
+            # acceptable for a retry buffer.
+            cursor = self.local_storage.cursor()
+
+            # Incremental autovacuum keeps the file bounded as pending
+            # operations churn inserts and deletes; it can only be enabled
+            # while the database is still empty.
+            if fresh_db:
+                cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+
             # Create tables for fallback storage
             self._create_fallback_tables()
             
@@ -133,56 +288,184 @@ class GracefulFallbackService:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     operation_type TEXT NOT NULL,
                     data_json TEXT NOT NULL,
+                    codec TEXT NOT NULL DEFAULT 'json',
                     created_at TEXT NOT NULL,
                     retry_count INTEGER DEFAULT 0
                 )
             ''')
+
+            # Migrate databases created before the codec column existed
+            try:
+                cursor.execute(
+                    "ALTER TABLE pending_operations ADD COLUMN codec TEXT NOT NULL DEFAULT 'json'"
+                )
+            except sqlite3.OperationalError:
+                pass
             
+            # The sync scan filters on retry_count; with (retry_count, id)
+            # plus data columns selected explicitly it becomes an index range
+            # lookup instead of a full-table scan each recovery cycle.
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_pending_retry
+                ON pending_operations(retry_count, id)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_artifacts_loan
+                ON fallback_artifacts(loan_id, created_at)
+            ''')
+
             self.local_storage.commit()
             logger.info("Fallback tables created successfully")
             
         except Exception as e:
             logger.error(f"Failed to create fallback tables: {e}")
     
+    def _writer_loop(self) -> None:
+        """Apply queued writes on the dedicated writer thread.
+
+        Commits when the queue drains so bursts of writes share one
+        transaction instead of committing per statement.
+        """
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                sql, params, reply = item
+                error = None
+                try:
+                    self.local_storage.execute(sql, params)
+                    # Waited writes commit immediately so the row is durable
+                    # before the caller is released; fire-and-forget writes
+                    # still batch until the queue drains.
+                    if reply is not None or self._write_queue.empty():
+                        self.local_storage.commit()
+                except Exception as e:
+                    error = e
+                    if reply is None:
+                        logger.error(f"Fallback write failed: {e}")
+                if reply is not None:
+                    reply[1] = error
+                    reply[0].set()
+            finally:
+                self._write_queue.task_done()
+
+    def _enqueue_write(self, sql: str, params: tuple, wait: bool = False) -> bool:
+        """Queue a write for the writer thread; False if storage is down.
+
+        With ``wait=True`` this blocks until the writer has applied the
+        statement and re-raises any failure in the calling thread, keeping
+        the synchronous error contract of a direct execute.
+        """
+        if self._writer_thread is None:
+            return False
+        if not wait:
+            self._write_queue.put((sql, params, None))
+            return True
+        reply = [threading.Event(), None]
+        self._write_queue.put((sql, params, reply))
+        reply[0].wait()
+        if reply[1] is not None:
+            raise reply[1]
+        return True
+
+    def _flush_writes(self) -> None:
+        """Block until all queued writes have been applied."""
+        if self._writer_thread is not None:
+            self._write_queue.join()
+
+    @property
+    def service_status(self) -> Dict[str, bool]:
+        """Per-service availability, projected from the status bitmap."""
+        bits = self._status_bits
+        return {service: bool(bits & bit) for service, bit in _SVC_BITS.items()}
+
     def set_service_status(self, service: str, available: bool) -> None:
         """Set service availability status."""
+        bit = _SVC_BITS[service]
         with self.fallback_lock:
-            self.service_status[service] = available
+            if available:
+                self._status_bits |= bit
+            else:
+                self._status_bits &= ~bit
             self._update_fallback_mode()
             logger.info(f"Service {service} status updated: {'available' if available else 'unavailable'}")
-    
+
     def _update_fallback_mode(self) -> None:
         """Update fallback mode based on service availability."""
-        available_services = sum(self.service_status.values())
-        total_services = len(self.service_status)
-        
+        available_services = self._status_bits.bit_count()
+        total_services = len(_SVC_BITS)
+
         if available_services == total_services:
-            self.current_mode = FallbackMode.NORMAL
+            idx = 0  # NORMAL
         elif available_services >= total_services // 2:
-            self.current_mode = FallbackMode.DEGRADED
+            idx = 1  # DEGRADED
         elif available_services > 0:
-            self.current_mode = FallbackMode.EMERGENCY
+            idx = 2  # EMERGENCY
         else:
-            self.current_mode = FallbackMode.OFFLINE
-        
+            idx = 3  # OFFLINE
+
+        self._mode_idx = idx
+        self.current_mode = _MODE_ORDER[idx]
+
         logger.info(f"Fallback mode updated to: {self.current_mode.value}")
     
     def execute_with_fallback(self, operation: Callable, *args, **kwargs) -> Any:
-        """Execute operation with fallback handling."""
-        with self.fallback_lock:
-            if self.current_mode == FallbackMode.NORMAL:
-                return self._execute_normal_operation(operation, *args, **kwargs)
-            elif self.current_mode == FallbackMode.DEGRADED:
+        """Execute operation with fallback handling.
+
+        Reads the current mode without taking fallback_lock: holding the
+        lock for the whole user operation made status updates wait on
+        arbitrarily slow callables. Dispatch is a single table load on the
+        mode index rather than an if/elif chain over enum comparisons.
+        """
+        # Happy path inlined: when everything is healthy the call costs one
+        # int compare plus the operation itself — no lock, no extra frame.
+        if self._mode_idx == 0:  # NORMAL
+            try:
+                result = operation(*args, **kwargs)
+                self._swr_cache[self._swr_key(operation, args, kwargs)] = result
+                return result
+            except Exception as e:
+                logger.warning(f"Normal operation failed, switching to degraded mode: {e}")
+                self._handle_service_failure()
                 return self._execute_degraded_operation(operation, *args, **kwargs)
-            elif self.current_mode == FallbackMode.EMERGENCY:
-                return self._execute_emergency_operation(operation, *args, **kwargs)
-            else:  # OFFLINE
-                return self._execute_offline_operation(operation, *args, **kwargs)
+        return self._dispatch[self._mode_idx](operation, *args, **kwargs)
     
+    @staticmethod
+    def _swr_key(operation: Callable, args: tuple, kwargs: dict) -> str:
+        """Cache key for a call; falls back to the bare name when the
+        arguments are unhashable."""
+        try:
+            return f"{operation.__name__}:{hash(args)}:{hash(frozenset(kwargs.items()))}"
+        except TypeError:
+            return operation.__name__
+
+    def _refresh_in_background(self, operation: Callable, args: tuple, kwargs: dict, key: str) -> None:
+        """Submit a refresh for a cached entry, coalescing concurrent requests."""
+        with self._swr_lock:
+            if key in self._swr_refreshing:
+                return
+            self._swr_refreshing.add(key)
+
+        def _refresh():
+            try:
+                self._swr_cache[key] = operation(*args, **kwargs)
+            except Exception as e:
+                logger.debug(f"Background refresh of {operation.__name__} failed: {e}")
+            finally:
+                with self._swr_lock:
+                    self._swr_refreshing.discard(key)
+
+        self._refresh_executor.submit(_refresh)
+
     def _execute_normal_operation(self, operation: Callable, *args, **kwargs) -> Any:
         """Execute operation in normal mode."""
         try:
-            return operation(*args, **kwargs)
+            result = operation(*args, **kwargs)
+            # Remember last-known-good results so degraded/offline callers
+            # get real data instead of a canned placeholder
+            self._swr_cache[self._swr_key(operation, args, kwargs)] = result
+            return result
         except Exception as e:
             logger.warning(f"Normal operation failed, switching to degraded mode: {e}")
             self._handle_service_failure()
@@ -220,6 +503,10 @@ class GracefulFallbackService:
         # Return cached data
         return self._get_cached_data(operation, *args, **kwargs)
     
+    def _new_fallback_id(self) -> str:
+        """Generate a collision-free local id for fallback records."""
+        return f"fallback_{time.monotonic_ns():x}_{next(self._id_counter):x}"
+
     def _handle_service_failure(self) -> None:
         """Handle service failure and update status."""
         # This would be called when a service fails
@@ -228,42 +515,59 @@ class GracefulFallbackService:
     
     def _store_pending_operation(self, operation: Callable, args: tuple, kwargs: dict) -> None:
         """Store operation for later retry."""
+        self.pending_operations.append((operation.__name__, time.monotonic()))
+
         if not self.local_storage:
             return
-        
+
         try:
-            cursor = self.local_storage.cursor()
-            
-            operation_data = {
-                'function_name': operation.__name__,
-                'args': args,
-                'kwargs': kwargs,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-            
-            cursor.execute('''
-                INSERT INTO pending_operations (operation_type, data_json, created_at)
-                VALUES (?, ?, ?)
-            ''', (
-                operation.__name__,
-                json.dumps(operation_data),
-                datetime.now(timezone.utc).isoformat()
-            ))
-            
-            self.local_storage.commit()
-            logger.info(f"Stored pending operation: {operation.__name__}")
-            
+            op_name = operation.__name__
+            encoder = _OP_CODECS.get(op_name)
+            if encoder is not None:
+                payload = _dumps({
+                    'function_name': op_name,
+                    'data': encoder(args, kwargs),
+                    'timestamp': _utc_now_iso()
+                })
+                codec = 'json'
+            else:
+                # No typed schema registered: pickle the raw call so
+                # non-JSON arguments don't lose the operation
+                payload = sqlite3.Binary(pickle.dumps(
+                    {'function_name': op_name, 'args': args, 'kwargs': kwargs},
+                    protocol=pickle.HIGHEST_PROTOCOL
+                ))
+                codec = 'pickle'
+
+            self._enqueue_write(_SQL_INSERT_PENDING, (
+                op_name,
+                payload,
+                codec,
+                _utc_now_iso()
+            ), wait=True)
+            logger.info(f"Stored pending operation: {op_name}")
+
         except Exception as e:
             logger.error(f"Failed to store pending operation: {e}")
     
     def _get_fallback_data(self, operation: Callable, *args, **kwargs) -> Any:
-        """Get fallback data when primary operation fails."""
+        """Get fallback data when primary operation fails.
+
+        Serves stale-while-revalidate: a last-known-good result is returned
+        immediately and refreshed in the background, so repeated calls under
+        degraded mode never wait on the failing service.
+        """
         operation_name = operation.__name__
-        
+
+        key = self._swr_key(operation, args, kwargs)
+        if key in self._swr_cache:
+            self._refresh_in_background(operation, args, kwargs, key)
+            return self._swr_cache[key]
+
         # Define fallback responses for different operations
         fallback_responses = {
             'insert_artifact': {
-                'id': f"fallback_{int(time.time())}",
+                'id': self._new_fallback_id(),
                 'status': 'stored_locally',
                 'message': 'Operation stored for later sync'
             },
@@ -279,11 +583,13 @@ class GracefulFallbackService:
     
     def _get_cached_data(self, operation: Callable, *args, **kwargs) -> Any:
         """Get cached data when offline."""
-        # In a real implementation, this would retrieve cached data
+        key = self._swr_key(operation, args, kwargs)
+        if key in self._swr_cache:
+            return self._swr_cache[key]
         return {
             'status': 'cached',
             'message': 'Retrieved from cache',
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': _utc_now_iso()
         }
     
     def sync_pending_operations(self) -> None:
@@ -294,35 +600,58 @@ class GracefulFallbackService:
         logger.info("Syncing pending operations...")
         
         try:
+            self._flush_writes()
             cursor = self.local_storage.cursor()
-            cursor.execute('SELECT * FROM pending_operations WHERE retry_count < ?', (self.config.max_retry_attempts,))
+            cursor.execute('''
+                SELECT id, operation_type, data_json, codec, retry_count
+                FROM pending_operations WHERE retry_count < ?
+            ''', (self.config.max_retry_attempts,))
             operations = cursor.fetchall()
-            
+
+            synced_ids = []
+            failed_ids = []
             for operation in operations:
-                op_id, op_type, data_json, created_at, retry_count = operation
-                
+                op_id, op_type, payload, codec, retry_count = operation
+
                 try:
                     # Parse operation data
-                    operation_data = json.loads(data_json)
-                    
+                    if codec == 'pickle':
+                        operation_data = pickle.loads(payload)
+                    else:
+                        operation_data = json.loads(payload)
+
                     # Execute the operation
                     # In a real implementation, this would call the actual function
                     logger.info(f"Retrying operation: {op_type}")
-                    
-                    # Mark as synced
-                    cursor.execute('DELETE FROM pending_operations WHERE id = ?', (op_id,))
-                    
+
+                    synced_ids.append((op_id,))
+
                 except Exception as e:
                     logger.warning(f"Failed to sync operation {op_id}: {e}")
-                    
-                    # Increment retry count
-                    cursor.execute('''
-                        UPDATE pending_operations 
-                        SET retry_count = retry_count + 1 
-                        WHERE id = ?
-                    ''', (op_id,))
-            
+                    failed_ids.append((op_id,))
+
+            # Apply all outcomes in one transaction instead of a commit-per-row
+            if synced_ids:
+                cursor.executemany('DELETE FROM pending_operations WHERE id = ?', synced_ids)
+            if failed_ids:
+                cursor.executemany('''
+                    UPDATE pending_operations
+                    SET retry_count = retry_count + 1
+                    WHERE id = ?
+                ''', failed_ids)
             self.local_storage.commit()
+
+            # Release pages freed by the drained operations and cap WAL growth
+            cursor.execute('PRAGMA incremental_vacuum(200)')
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+            # Trim the in-memory view to match the durable table, otherwise
+            # get_status() keeps reporting operations that no longer exist
+            cursor.execute('SELECT COUNT(*) FROM pending_operations')
+            remaining = cursor.fetchone()[0]
+            while len(self.pending_operations) > remaining:
+                self.pending_operations.popleft()
+
             logger.info(f"Synced {len(operations)} pending operations")
             
         except Exception as e:
@@ -334,16 +663,9 @@ class GracefulFallbackService:
             raise Exception("Local storage not available")
         
         try:
-            cursor = self.local_storage.cursor()
-            
-            artifact_id = artifact_data.get('id', f"fallback_{int(time.time())}")
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO fallback_artifacts 
-                (id, loan_id, artifact_type, etid, payload_sha256, walacor_tx_id, 
-                 created_by, created_at, data_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            artifact_id = artifact_data.get('id') or self._new_fallback_id()
+
+            self._enqueue_write(_SQL_INSERT_ARTIFACT, (
                 artifact_id,
                 artifact_data.get('loan_id'),
                 artifact_data.get('artifact_type'),
@@ -351,13 +673,11 @@ class GracefulFallbackService:
                 artifact_data.get('payload_sha256'),
                 artifact_data.get('walacor_tx_id'),
                 artifact_data.get('created_by'),
-                datetime.now(timezone.utc).isoformat(),
-                json.dumps(artifact_data)
-            ))
-            
-            self.local_storage.commit()
+                _utc_now_iso(),
+                _dumps(artifact_data)
+            ), wait=True)
             logger.info(f"Stored fallback artifact: {artifact_id}")
-            
+
             return artifact_id
             
         except Exception as e:
@@ -368,8 +688,10 @@ class GracefulFallbackService:
         """Get artifact from fallback storage."""
         if not self.local_storage:
             return None
-        
+
         try:
+            # Ensure queued writes are visible before reading
+            self._flush_writes()
             cursor = self.local_storage.cursor()
             cursor.execute('SELECT data_json FROM fallback_artifacts WHERE id = ?', (artifact_id,))
             result = cursor.fetchone()
@@ -388,7 +710,7 @@ class GracefulFallbackService:
             'mode': self.current_mode.value,
             'services': self.service_status,
             'local_storage_available': self.local_storage is not None,
-            'pending_operations': len(self.pending_operations) if hasattr(self, 'pending_operations') else 0
+            'pending_operations': len(self.pending_operations)
         }
     
     def recover_services(self) -> None:
@@ -414,19 +736,18 @@ class GracefulFallbackService:
         if self.current_mode == FallbackMode.NORMAL:
             self.sync_pending_operations()
 
-# Global fallback service instance
-_fallback_service_instance: Optional[GracefulFallbackService] = None
-
+@functools.lru_cache(maxsize=1)
 def get_fallback_service() -> GracefulFallbackService:
-    """Get the global fallback service instance."""
-    global _fallback_service_instance
-    if _fallback_service_instance is None:
-        _fallback_service_instance = GracefulFallbackService()
-    return _fallback_service_instance
+    """Get the global fallback service instance (created on first use)."""
+    return GracefulFallbackService()
 
 def with_fallback(operation: Callable):
     """Decorator to add fallback handling to operations."""
+    # Resolve the singleton once at decoration time so each wrapped call
+    # skips the lookup and just dispatches through the bound service
+    fallback_service = get_fallback_service()
+    execute = fallback_service.execute_with_fallback
+
     def wrapper(*args, **kwargs):
-        fallback_service = get_fallback_service()
-        return fallback_service.execute_with_fallback(operation, *args, **kwargs)
+        return execute(operation, *args, **kwargs)
     return wrapper
@@ -11,18 +11,53 @@ This module provides comprehensive health monitoring for the entire platform inc
 
 import asyncio
 import logging
+import os
+import random
 import time
 import threading
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
+import queue
 import requests
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+# Probe Walacor availability once at import time; the health check only
+# needs the outcome, not a fresh import machinery walk every cycle.
+try:
+    from .walacor_service import WalacorIntegrityService
+    _WALACOR_AVAILABLE = True
+    _WALACOR_IMPORT_ERROR = None
+except Exception as _e:
+    WalacorIntegrityService = None
+    _WALACOR_AVAILABLE = False
+    _WALACOR_IMPORT_ERROR = str(_e)
+
 logger = logging.getLogger(__name__)
 
+# Shared executor for synchronous health-check callables: one pool for the
+# process instead of constructing and tearing one down every cycle.
+_check_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix='health-check')
+
+# API health endpoint, overridable per deployment
+_API_URL = os.getenv('HEALTH_API_URL', 'http://localhost:8000/api/health')
+
+# Persistent HTTP client for the API health check so every probe reuses a
+# kept-alive connection instead of paying a TCP handshake per cycle.
+if HAS_HTTPX:
+    _api_client = httpx.Client(timeout=10.0)
+else:
+    _api_client = requests.Session()
+
 class HealthStatus(Enum):
     """Health status enumeration."""
     HEALTHY = "healthy"
@@ -30,7 +65,11 @@ class HealthStatus(Enum):
     CRITICAL = "critical"
     UNKNOWN = "unknown"
 
-@dataclass
+# Direct value-to-member lookup; avoids the enum constructor and maps
+# unrecognized strings to UNKNOWN instead of raising ValueError
+_STATUS_BY_VALUE = {status.value: status for status in HealthStatus}
+
+@dataclass(slots=True)
 class HealthCheckResult:
     """Health check result."""
     service: str
@@ -39,17 +78,25 @@ class HealthCheckResult:
     response_time_ms: float
     timestamp: datetime
     details: Dict[str, Any] = None
-    
+    _dict_view: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            'service': self.service,
-            'status': self.status.value,
-            'message': self.message,
-            'response_time_ms': self.response_time_ms,
-            'timestamp': self.timestamp.isoformat(),
-            'details': self.details or {}
-        }
+        """Convert to dictionary.
+
+        Results are immutable once built, so the dictionary (including
+        the formatted timestamp) is computed once and reused across the
+        overall snapshot, history views and alert payloads.
+        """
+        if self._dict_view is None:
+            self._dict_view = {
+                'service': self.service,
+                'status': self.status.value,
+                'message': self.message,
+                'response_time_ms': self.response_time_ms,
+                'timestamp': self.timestamp.isoformat(),
+                'details': self.details or {}
+            }
+        return self._dict_view
 
 class HealthMonitor:
     """
@@ -63,35 +110,75 @@ class HealthMonitor:
     - Application services
     """
     
-    def __init__(self, check_interval: int = 30, alert_threshold: int = 3):
+    def __init__(self, check_interval: int = 30, alert_threshold: int = 3,
+                 max_concurrent_checks: int = 10, fail_on_timeout: bool = False):
         """
         Initialize health monitor.
-        
+
         Args:
             check_interval: Health check interval in seconds
             alert_threshold: Number of consecutive failures before alerting
+            max_concurrent_checks: Maximum health checks running at once
+            fail_on_timeout: Treat timed-out checks as CRITICAL instead of WARNING
         """
         self.check_interval = check_interval
         self.alert_threshold = alert_threshold
+        self.max_concurrent_checks = max_concurrent_checks
+        self.fail_on_timeout = fail_on_timeout
+
+        # Operational counters (e.g. how often checks time out)
+        self.metrics: Counter = Counter()
         self.monitoring = False
         self.monitor_thread = None
         self.shutdown_event = threading.Event()
+
+        # Guards the result histories and derived state shared between
+        # the monitor thread and API readers
+        self._lock = threading.RLock()
         
-        # Health check results
-        self.health_results: Dict[str, List[HealthCheckResult]] = {}
+        # Health check results, bounded to the last 100 per service
+        self.health_results: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+
+        # Latest result per service for O(1) reads without touching the
+        # history deques
+        self._latest: Dict[str, HealthCheckResult] = {}
+
+        # Incremental view of the latest status per service plus a tally
+        # per status, so the overall reduction is O(1) instead of a walk
+        # over every service history
+        self._latest_status: Dict[str, HealthStatus] = {}
+        self._status_counts: Counter = Counter()
+
+        # Memoized overall-health snapshot: (expires_at, payload)
+        self._overall_cache: Optional[tuple] = None
+        self._overall_cache_lock = threading.Lock()
+        self._overall_cache_ttl = 10.0
         self.consecutive_failures: Dict[str, int] = {}
         
-        # Alert handlers
+        # Alert handlers, invoked from a dedicated worker thread fed by a
+        # bounded queue so slow handlers never stall the check cycle
         self.alert_handlers: List[Callable] = []
+        self._alert_queue: queue.Queue = queue.Queue(maxsize=1024)
+        self._alert_thread = threading.Thread(
+            target=self._alert_worker,
+            daemon=True,
+            name="HealthAlerts"
+        )
+        self._alert_thread.start()
         
-        # Health check functions
+        # Health check functions and their jittered next-run deadlines
+        # (monotonic seconds); staggering the services keeps every probe
+        # from hitting its dependency at the same instant
         self.health_checks: Dict[str, Callable] = {}
+        self._next_due: Dict[str, float] = {}
         
         logger.info("Health monitor initialized")
     
     def add_health_check(self, service: str, check_function: Callable) -> None:
         """Add a health check function for a service."""
         self.health_checks[service] = check_function
+        # Spread first runs across the interval instead of a startup stampede
+        self._next_due[service] = time.monotonic() + random.uniform(0, self.check_interval)
         logger.info(f"Added health check for service: {service}")
     
     def add_alert_handler(self, handler: Callable) -> None:
@@ -107,7 +194,17 @@ class HealthMonitor:
         
         self.monitoring = True
         self.shutdown_event.clear()
-        
+
+        # stop_monitoring terminates the alert worker with a sentinel, so a
+        # restart needs a fresh worker or alerts queue up with no consumer
+        if not self._alert_thread.is_alive():
+            self._alert_thread = threading.Thread(
+                target=self._alert_worker,
+                daemon=True,
+                name="HealthAlerts"
+            )
+            self._alert_thread.start()
+
         self.monitor_thread = threading.Thread(
             target=self._monitoring_loop,
             daemon=True,
@@ -127,72 +224,190 @@ class HealthMonitor:
         
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
-        
+
+        # Let the alert worker drain and exit
+        try:
+            self._alert_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._alert_thread.is_alive():
+            self._alert_thread.join(timeout=5)
+
         logger.info("Health monitoring stopped")
     
     def _monitoring_loop(self) -> None:
-        """Main monitoring loop."""
-        while not self.shutdown_event.is_set():
-            try:
-                self._perform_all_health_checks()
-                time.sleep(self.check_interval)
-            except Exception as e:
-                logger.error(f"Health monitoring error: {e}")
-                time.sleep(5)
-    
-    def _perform_all_health_checks(self) -> None:
-        """Perform all health checks."""
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {
-                executor.submit(self._perform_health_check, service, check_func): service
-                for service, check_func in self.health_checks.items()
-            }
-            
-            for future in futures:
-                service = futures[future]
+        """Main monitoring loop.
+
+        Owns a private event loop so the per-cycle fan-out can run the
+        checks concurrently via asyncio.
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while not self.shutdown_event.is_set():
                 try:
-                    result = future.result(timeout=30)
-                    self._process_health_result(service, result)
+                    loop.run_until_complete(self._perform_all_health_checks())
+                    # Wake in short quanta so jittered per-service deadlines
+                    # are honoured; the wait on the shutdown event keeps the
+                    # pause interruptible and stop_monitoring prompt
+                    if self.shutdown_event.wait(min(self.check_interval, 5)):
+                        break
                 except Exception as e:
-                    logger.error(f"Health check failed for {service}: {e}")
-                    self._process_health_result(service, HealthCheckResult(
+                    logger.error(f"Health monitoring error: {e}")
+                    if self.shutdown_event.wait(5):
+                        break
+        finally:
+            loop.close()
+
+    async def _perform_all_health_checks(self) -> None:
+        """Perform all health checks concurrently.
+
+        Every check gets its own timeout and all of them run under one
+        asyncio.wait, so a cycle takes as long as the slowest check
+        rather than a serialized walk over the futures. The whole cycle
+        is additionally capped at 80% of the check interval so a single
+        stuck check can never make the monitor drift behind schedule.
+        """
+        # Nothing registered: skip the fan-out machinery entirely
+        if not self.health_checks:
+            return
+
+        # Only run checks whose jittered deadline has passed
+        cycle_start = time.monotonic()
+        due_checks = {
+            service: check_func
+            for service, check_func in self.health_checks.items()
+            if self._next_due.get(service, 0.0) <= cycle_start
+        }
+        if not due_checks:
+            return
+
+        loop = asyncio.get_running_loop()
+        budget = self.check_interval * 0.8
+
+        # Bound the fan-out so a large check registry cannot swamp the
+        # executor or downstream services
+        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+
+        async def run_check(service: str, check_func: Callable) -> HealthCheckResult:
+            async with semaphore:
+                if asyncio.iscoroutinefunction(check_func):
+                    return await self._perform_health_check_async(service, check_func)
+                return await loop.run_in_executor(
+                    _check_executor, self._perform_health_check, service, check_func
+                )
+
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(run_check(service, check_func), timeout=30)): service
+            for service, check_func in due_checks.items()
+        }
+
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+
+        if pending:
+            for task in pending:
+                task.cancel()
+            # Give cancellation a moment to propagate; executor-backed tasks
+            # may keep their worker thread busy but the cycle moves on.
+            await asyncio.wait(pending, timeout=0.1)
+
+        # One timestamp capture covers every synthetic result in this cycle
+        now = datetime.now(timezone.utc)
+
+        # A slow dependency is a degradation signal, not proof of an
+        # outage, so timeouts map to WARNING unless fail_on_timeout is set
+        timeout_status = HealthStatus.CRITICAL if self.fail_on_timeout else HealthStatus.WARNING
+
+        for task in tasks:
+            service = tasks[task]
+            if task in pending:
+                logger.warning(f"Health check for {service} exceeded cycle budget of {budget:.1f}s")
+                self.metrics['timeouts'] += 1
+                result = HealthCheckResult(
+                    service=service,
+                    status=timeout_status,
+                    message=f"Health check timed out after {budget:.1f}s cycle budget",
+                    response_time_ms=budget * 1000,
+                    timestamp=now
+                )
+            elif (exc := task.exception()) is not None:
+                if isinstance(exc, asyncio.TimeoutError):
+                    logger.warning(f"Health check for {service} timed out")
+                    self.metrics['timeouts'] += 1
+                    result = HealthCheckResult(
+                        service=service,
+                        status=timeout_status,
+                        message="Health check timed out",
+                        response_time_ms=30_000.0,
+                        timestamp=now
+                    )
+                else:
+                    logger.error(f"Health check failed for {service}: {exc}")
+                    result = HealthCheckResult(
                         service=service,
                         status=HealthStatus.UNKNOWN,
-                        message=f"Health check failed: {str(e)}",
+                        message=f"Health check failed: {str(exc)}",
                         response_time_ms=0.0,
-                        timestamp=datetime.now(timezone.utc)
-                    ))
-    
-    def _perform_health_check(self, service: str, check_function: Callable) -> HealthCheckResult:
-        """Perform a single health check."""
-        start_time = time.time()
-        
-        try:
-            result = check_function()
-            response_time = (time.time() - start_time) * 1000
-            
-            if isinstance(result, dict):
-                status = HealthStatus(result.get('status', 'unknown'))
-                message = result.get('message', 'OK')
-                details = result.get('details', {})
-            elif isinstance(result, HealthCheckResult):
-                return result
+                        timestamp=now
+                    )
             else:
-                status = HealthStatus.HEALTHY
-                message = "OK"
-                details = {}
-            
+                result = task.result()
+            # Reschedule with a little jitter to keep services de-phased
+            self._next_due[service] = time.monotonic() + self.check_interval + random.uniform(-2, 2)
+            self._process_health_result(service, result)
+
+    async def _perform_health_check_async(self, service: str, check_function: Callable) -> HealthCheckResult:
+        """Perform a single health check for a native-async check function."""
+        start_time = time.perf_counter()
+
+        try:
+            result = await check_function()
+            response_time = (time.perf_counter() - start_time) * 1000
+            return self._build_check_result(service, result, response_time)
+
+        except Exception as e:
+            response_time = (time.perf_counter() - start_time) * 1000
             return HealthCheckResult(
                 service=service,
-                status=status,
-                message=message,
+                status=HealthStatus.CRITICAL,
+                message=f"Health check failed: {str(e)}",
                 response_time_ms=response_time,
-                timestamp=datetime.now(timezone.utc),
-                details=details
+                timestamp=datetime.now(timezone.utc)
             )
-            
+    
+    def _build_check_result(self, service: str, result: Any, response_time: float) -> HealthCheckResult:
+        """Build a HealthCheckResult from a check function's return value."""
+        if isinstance(result, dict):
+            status = _STATUS_BY_VALUE.get(result.get('status'), HealthStatus.UNKNOWN)
+            message = result.get('message', 'OK')
+            details = result.get('details', {})
+        elif isinstance(result, HealthCheckResult):
+            return result
+        else:
+            status = HealthStatus.HEALTHY
+            message = "OK"
+            details = {}
+
+        return HealthCheckResult(
+            service=service,
+            status=status,
+            message=message,
+            response_time_ms=response_time,
+            timestamp=datetime.now(timezone.utc),
+            details=details
+        )
+
+    def _perform_health_check(self, service: str, check_function: Callable) -> HealthCheckResult:
+        """Perform a single health check."""
+        start_time = time.perf_counter()
+
+        try:
+            result = check_function()
+            response_time = (time.perf_counter() - start_time) * 1000
+            return self._build_check_result(service, result, response_time)
+
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             return HealthCheckResult(
                 service=service,
                 status=HealthStatus.CRITICAL,
@@ -203,79 +418,117 @@ class HealthMonitor:
     
     def _process_health_result(self, service: str, result: HealthCheckResult) -> None:
         """Process health check result."""
-        # Store result
-        if service not in self.health_results:
-            self.health_results[service] = []
-        
-        self.health_results[service].append(result)
-        
-        # Keep only last 100 results
-        if len(self.health_results[service]) > 100:
-            self.health_results[service] = self.health_results[service][-100:]
-        
-        # Update consecutive failures
-        if result.status == HealthStatus.CRITICAL:
-            self.consecutive_failures[service] = self.consecutive_failures.get(service, 0) + 1
-        else:
-            self.consecutive_failures[service] = 0
-        
-        # Check for alerts
-        if self.consecutive_failures.get(service, 0) >= self.alert_threshold:
+        with self._lock:
+            # Store result; the deque drops entries beyond the last 100 itself
+            previous_status = self._latest_status.get(service)
+            self.health_results[service].append(result)
+            self._latest[service] = result
+
+            # Maintain the incremental per-status tally
+            self._latest_status[service] = result.status
+            if previous_status is not None:
+                self._status_counts[previous_status] -= 1
+            self._status_counts[result.status] += 1
+
+            # A status transition makes the memoized overall snapshot stale
+            if result.status is not previous_status:
+                with self._overall_cache_lock:
+                    self._overall_cache = None
+
+            # Update consecutive failures
+            if result.status == HealthStatus.CRITICAL:
+                self.consecutive_failures[service] = self.consecutive_failures.get(service, 0) + 1
+            else:
+                self.consecutive_failures[service] = 0
+
+            failures = self.consecutive_failures[service]
+
+        # Alert outside the lock; handlers may be arbitrarily slow
+        if failures >= self.alert_threshold:
             self._trigger_alert(service, result)
         
         logger.debug(f"Health check result for {service}: {result.status.value} - {result.message}")
     
     def _trigger_alert(self, service: str, result: HealthCheckResult) -> None:
         """Trigger alert for service failure."""
+        result_view = result.to_dict()
         alert_data = {
             'service': service,
-            'status': result.status.value,
-            'message': result.message,
-            'timestamp': result.timestamp.isoformat(),
+            'status': result_view['status'],
+            'message': result_view['message'],
+            'timestamp': result_view['timestamp'],
             'consecutive_failures': self.consecutive_failures.get(service, 0)
         }
         
         logger.warning(f"ALERT: Service {service} is unhealthy - {result.message}")
-        
-        # Call all alert handlers
-        for handler in self.alert_handlers:
-            try:
-                handler(alert_data)
-            except Exception as e:
-                logger.error(f"Alert handler failed: {e}")
+
+        # Hand off to the alert worker; drop (with a log) if the queue is
+        # saturated rather than blocking the check cycle
+        try:
+            self._alert_queue.put_nowait(alert_data)
+        except queue.Full:
+            logger.error(f"Alert queue full; dropping alert for {service}")
+
+    def _alert_worker(self) -> None:
+        """Drain the alert queue and run handlers off the monitor thread."""
+        while True:
+            alert_data = self._alert_queue.get()
+            if alert_data is None:  # Shutdown sentinel
+                break
+            for handler in self.alert_handlers:
+                try:
+                    handler(alert_data)
+                except Exception as e:
+                    logger.error(f"Alert handler failed: {e}")
     
     def get_overall_health(self) -> Dict[str, Any]:
-        """Get overall system health."""
-        if not self.health_results:
-            return {
-                'status': HealthStatus.UNKNOWN.value,
-                'message': 'No health checks performed yet',
-                'services': {},
-                'timestamp': datetime.now(timezone.utc).isoformat()
+        """Get overall system health.
+
+        The aggregated snapshot is memoized for a short TTL and
+        invalidated early whenever a service changes status, so hot
+        dashboard polling does not rebuild it on every request.
+        """
+        now = time.monotonic()
+        with self._overall_cache_lock:
+            cached = self._overall_cache
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        health = self._build_overall_health()
+
+        with self._overall_cache_lock:
+            self._overall_cache = (now + self._overall_cache_ttl, health)
+        return health
+
+    def _build_overall_health(self) -> Dict[str, Any]:
+        """Build the overall system health snapshot."""
+        with self._lock:
+            if not self.health_results:
+                return {
+                    'status': HealthStatus.UNKNOWN.value,
+                    'message': 'No health checks performed yet',
+                    'services': {},
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                }
+
+            service_statuses = {
+                service: result.to_dict()
+                for service, result in self._latest.items()
             }
-        
-        # Determine overall status
-        all_statuses = []
-        service_statuses = {}
-        
-        for service, results in self.health_results.items():
-            if results:
-                latest_result = results[-1]
-                all_statuses.append(latest_result.status)
-                service_statuses[service] = latest_result.to_dict()
-        
-        if not all_statuses:
-            overall_status = HealthStatus.UNKNOWN
-            message = "No recent health check results"
-        elif HealthStatus.CRITICAL in all_statuses:
-            overall_status = HealthStatus.CRITICAL
-            message = "One or more services are critical"
-        elif HealthStatus.WARNING in all_statuses:
-            overall_status = HealthStatus.WARNING
-            message = "One or more services have warnings"
-        else:
-            overall_status = HealthStatus.HEALTHY
-            message = "All services are healthy"
+
+            # Reduce from the incremental per-status tally
+            if not self._latest_status:
+                overall_status = HealthStatus.UNKNOWN
+                message = "No recent health check results"
+            elif self._status_counts[HealthStatus.CRITICAL] > 0:
+                overall_status = HealthStatus.CRITICAL
+                message = "One or more services are critical"
+            elif self._status_counts[HealthStatus.WARNING] > 0:
+                overall_status = HealthStatus.WARNING
+                message = "One or more services have warnings"
+            else:
+                overall_status = HealthStatus.HEALTHY
+                message = "All services are healthy"
         
         return {
             'status': overall_status.value,
@@ -286,23 +539,25 @@ class HealthMonitor:
     
     def get_service_health(self, service: str) -> Dict[str, Any]:
         """Get health status for a specific service."""
-        if service not in self.health_results or not self.health_results[service]:
-            return {
-                'status': HealthStatus.UNKNOWN.value,
-                'message': 'No health check results available',
-                'history': [],
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-        
-        results = self.health_results[service]
-        latest_result = results[-1]
-        
+        with self._lock:
+            latest_result = self._latest.get(service)
+            if latest_result is None:
+                return {
+                    'status': HealthStatus.UNKNOWN.value,
+                    'message': 'No health check results available',
+                    'history': [],
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                }
+
+            history = list(self.health_results[service])[-10:]  # Last 10 results
+            failures = self.consecutive_failures.get(service, 0)
+
         return {
             'status': latest_result.status.value,
             'message': latest_result.message,
             'response_time_ms': latest_result.response_time_ms,
-            'history': [result.to_dict() for result in results[-10:]],  # Last 10 results
-            'consecutive_failures': self.consecutive_failures.get(service, 0),
+            'history': [result.to_dict() for result in history],
+            'consecutive_failures': failures,
             'timestamp': latest_result.timestamp.isoformat()
         }
 
@@ -337,9 +592,13 @@ def check_database_health() -> Dict[str, Any]:
 def check_api_health() -> Dict[str, Any]:
     """Check API health."""
     try:
-        # Check if the API is responding
-        response = requests.get('http://localhost:8000/api/health', timeout=10)
-        
+        # Check if the API is responding; the shared client keeps the
+        # connection alive between cycles
+        if HAS_HTTPX:
+            response = _api_client.get(_API_URL)
+        else:
+            response = _api_client.get(_API_URL, timeout=10)
+
         if response.status_code == 200:
             return {
                 'status': 'healthy',
@@ -352,7 +611,7 @@ def check_api_health() -> Dict[str, Any]:
                 'message': f"API returned status {response.status_code}",
                 'details': {'status_code': response.status_code}
             }
-    except requests.exceptions.RequestException as e:
+    except Exception as e:
         return {
             'status': 'critical',
             'message': f"API is not responding: {str(e)}",
@@ -361,22 +620,19 @@ def check_api_health() -> Dict[str, Any]:
 
 def check_walacor_health() -> Dict[str, Any]:
     """Check Walacor service health."""
-    try:
-        # This would check Walacor blockchain connectivity
-        # For now, return healthy if we can import the service
-        from .walacor_service import WalacorIntegrityService
-        
+    # This would check Walacor blockchain connectivity
+    # For now, report the availability probed once at import time
+    if _WALACOR_AVAILABLE:
         return {
             'status': 'healthy',
             'message': 'Walacor service is available',
             'details': {}
         }
-    except Exception as e:
-        return {
-            'status': 'warning',
-            'message': f"Walacor service check failed: {str(e)}",
-            'details': {}
-        }
+    return {
+        'status': 'warning',
+        'message': f"Walacor service check failed: {_WALACOR_IMPORT_ERROR}",
+        'details': {}
+    }
 
 # Global health monitor instance
 _health_monitor_instance: Optional[HealthMonitor] = None
@@ -16,12 +16,92 @@ Author: IntegrityX Team
 import re
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
-from difflib import SequenceMatcher
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 logger = logging.getLogger(__name__)
 
+# Single C-level pass strips the separators; the cache covers the same key
+# recurring across sibling records (arrays of uniform objects)
+_NORM_TABLE = str.maketrans('', '', '_- ')
+
+
+@lru_cache(maxsize=4096)
+def _normalize(key: str) -> str:
+    """Normalize a field name for matching (lowercase, no separators)."""
+    return key.lower().translate(_NORM_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def _lower(key: str) -> str:
+    """Lower-cased view of a key, cached across repeated occurrences."""
+    return key.lower()
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _best_ratio(key_bytes, var_matrix, var_lens):  # pragma: no cover - needs numba
+        """Return (index, ratio) of the variation closest to the key.
+
+        Normalized Levenshtein over ASCII byte buffers with a rolling
+        int16 DP row; JIT compilation removes the interpreter overhead
+        from the quadratic inner loop.
+        """
+        key_len = key_bytes.shape[0]
+        prev = np.empty(key_len + 1, dtype=np.int16)
+        curr = np.empty(key_len + 1, dtype=np.int16)
+        best_idx = -1
+        best = 0.0
+
+        for v in range(var_matrix.shape[0]):
+            var_len = var_lens[v]
+            for j in range(key_len + 1):
+                prev[j] = j
+            for i in range(1, var_len + 1):
+                curr[0] = i
+                var_char = var_matrix[v, i - 1]
+                for j in range(1, key_len + 1):
+                    cost = 0 if key_bytes[j - 1] == var_char else 1
+                    dist = prev[j] + 1
+                    if curr[j - 1] + 1 < dist:
+                        dist = curr[j - 1] + 1
+                    if prev[j - 1] + cost < dist:
+                        dist = prev[j - 1] + cost
+                    curr[j] = dist
+                for j in range(key_len + 1):
+                    prev[j] = curr[j]
+
+            denom = key_len if key_len > var_len else var_len
+            if denom > 0:
+                ratio = 1.0 - prev[key_len] / denom
+                if ratio > best:
+                    best = ratio
+                    best_idx = v
+
+        return best_idx, best
+
 
 class IntelligentExtractor:
     """
@@ -93,6 +173,50 @@ class IntelligentExtractor:
             ]
         }
 
+        # Trie over the normalized variations of every field, so a dict
+        # key can be scored against all variations of all fields in one
+        # O(len(key)) descent instead of a SequenceMatcher call per pair
+        self._variation_trie = self._build_variation_trie()
+
+        # Flat list of normalized variations and their owning field, used
+        # by the RapidFuzz refinement for keys the trie scores poorly
+        # (typos and rearrangements that share no useful prefix)
+        self._variation_owner: Dict[str, str] = {}
+        for field, variations in self.field_variations.items():
+            for variation in variations:
+                self._variation_owner.setdefault(self._normalize_key(variation), field)
+        self._variations_normalized = list(self._variation_owner)
+
+        # Byte matrix of the normalized variations for the Numba kernel
+        # used when RapidFuzz is not available
+        if HAS_NUMBA:
+            encoded = [v.encode('ascii', 'ignore') for v in self._variations_normalized]
+            width = max(len(b) for b in encoded)
+            self._variation_matrix = np.zeros((len(encoded), width), dtype=np.uint8)
+            self._variation_lens = np.array([len(b) for b in encoded], dtype=np.int64)
+            for i, b in enumerate(encoded):
+                self._variation_matrix[i, :len(b)] = np.frombuffer(b, dtype=np.uint8)
+
+        # Each field's patterns merged into one compiled alternation, plus
+        # a master alternation with named groups so one regex call per
+        # leaf identifies which field (if any) the value's format matches
+        self._field_pattern = {
+            field: re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+            for field, patterns in self.value_patterns.items()
+        }
+        self._any_field_pattern = re.compile(
+            '|'.join(
+                f"(?P<{field}>{'|'.join(f'(?:{p})' for p in patterns)})"
+                for field, patterns in self.value_patterns.items()
+            ),
+            re.IGNORECASE
+        )
+
+        # Helper regexes used during validation, compiled once so the hot
+        # traversal never touches the re-cache
+        self._name_re = re.compile(r"^[A-Za-z\s\-'.]+$")
+        self._digits_re = re.compile(r'\d+')
+
         # Common nested paths to check (performance optimization)
         self.common_paths = {
             'loan_id': [
@@ -136,22 +260,31 @@ class IntelligentExtractor:
             ]
         }
 
+        # Trie over the common paths of every field: one descent of the
+        # document checks all known paths simultaneously instead of
+        # probing fields x paths x depth with case-insensitive key scans
+        self._path_trie = self._build_path_trie()
+
     def extract_from_document(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract data from any JSON document structure.
 
         Args:
-            json_data: The JSON document data
+            json_data: The JSON document data (parsed value, or raw
+                JSON bytes which are parsed here with orjson when
+                available; a str is treated as an already-parsed
+                document value, since valid JSON can be a bare string)
 
         Returns:
             Dictionary with extracted fields and confidence scores
         """
+        if isinstance(json_data, (bytes, bytearray)):
+            json_data = _loads(json_data)
+
         extracted = {}
         confidence_scores = {}
 
-        for field_name in self.field_variations.keys():
-            value, confidence = self._extract_field_intelligent(json_data, field_name)
-
+        for field_name, (value, confidence) in self._extract_all(json_data).items():
             if value:
                 extracted[field_name] = value
                 confidence_scores[field_name] = confidence
@@ -163,161 +296,287 @@ class IntelligentExtractor:
             'overall_confidence': self._calculate_overall_confidence(confidence_scores)
         }
 
-    def _extract_field_intelligent(
-        self,
-        json_data: Dict[str, Any],
-        field_name: str
-    ) -> Tuple[Optional[str], float]:
+    def _extract_all(self, json_data: Dict[str, Any]) -> Dict[str, Tuple[Optional[str], float]]:
         """
-        Intelligently extract a field using multiple strategies.
+        Extract every target field in a single traversal of the document.
 
-        Strategies (in order of priority):
+        Strategies (in order of priority), as before:
         1. Check common nested paths
         2. Fuzzy field name matching (deep search)
         3. Pattern recognition on values
-        4. Semantic analysis
+
+        The fuzzy and pattern strategies used to re-walk the whole JSON
+        tree once per field; here one DFS scores each dict key against all
+        fields via the variation trie and tests each leaf against the
+        value patterns of every field still missing a candidate.
 
         Returns:
-            Tuple of (extracted_value, confidence_score)
+            Mapping of field name to (value, confidence) tuples
         """
+        fields = self.field_variations
+        best: Dict[str, Tuple[Optional[str], float]] = {field: (None, 0.0) for field in fields}
+
+        # A scalar document (bare number, string, bool or null) has no
+        # structure to walk; every field simply comes back empty
+        if not isinstance(json_data, (dict, list)):
+            return best
+
+        pattern_hits: Dict[str, str] = {}
+        path_hits: Dict[str, Tuple[int, str]] = {}
+        resolved = set()
+
+        # Walk iteratively with a stack of (iterator, cursors) frames: no
+        # Python call frame per node, identical preorder to the old
+        # recursion, and a clean early exit once every field has hit its
+        # top-priority common path. The cursors are the path-trie nodes
+        # still in play at the current nesting level, so strategy 1 rides
+        # along with the fuzzy and pattern sweeps instead of probing each
+        # field's paths separately.
+        stack = [(
+            self._iter_entries(json_data),
+            (self._path_trie,) if isinstance(json_data, dict) else ()
+        )]
+        done = False
+
+        while stack and not done:
+            frame, cursors = stack[-1]
+            descended = False
+
+            for key, value in frame:
+                child_cursors = ()
+                if key is not None:
+                    # Strategy 1: advance any active common-path cursors
+                    if cursors:
+                        key_lower = _lower(key if isinstance(key, str) else str(key))
+                        advanced = []
+                        for cursor in cursors:
+                            child = cursor.get(key_lower)
+                            if child is None:
+                                continue
+                            terminals = child.get('$')
+                            if terminals and value:
+                                for field, priority in terminals:
+                                    hit = path_hits.get(field)
+                                    if hit is None or priority < hit[0]:
+                                        path_hits[field] = (priority, str(value))
+                                        if priority == 0:
+                                            resolved.add(field)
+                            advanced.append(child)
+                        child_cursors = tuple(advanced)
+
+                        if len(resolved) == len(fields):
+                            done = True
+                            break
 
-        # Strategy 1: Check common nested paths first (fast)
-        if field_name in self.common_paths:
-            for path in self.common_paths[field_name]:
-                value = self._get_nested_value(json_data, path)
-                if value:
-                    return str(value), 0.95  # High confidence for known paths
-
-        # Strategy 2: Fuzzy field name matching (deep search)
-        value, confidence = self._fuzzy_field_search(json_data, field_name)
-        if value and confidence > 0.7:
-            return value, confidence
-
-        # Strategy 3: Pattern recognition on all values
-        pattern_value, pattern_confidence = self._pattern_based_search(
-            json_data,
-            field_name
-        )
-        if pattern_value and pattern_confidence > 0.6:
-            # If we found something via pattern but lower confidence than fuzzy,
-            # compare and take the better one
-            if confidence > pattern_confidence:
-                return value, confidence
-            return pattern_value, pattern_confidence
+                    # Strategy 2: one trie descent scores this key against
+                    # every field at once. Stringify the value once and
+                    # share it across every field's validation.
+                    scores = self._key_field_scores(self._normalize_key(key))
+                    if scores and value is not None:
+                        value_text = value if isinstance(value, str) else str(value)
+                        value_stripped = value_text.strip()
+                        for field, confidence in scores.items():
+                            if field in resolved or confidence <= best[field][1]:
+                                continue
+                            if self._validate_value_for_field(field, value, value_stripped):
+                                best[field] = (value_text, confidence)
+
+                if isinstance(value, (dict, list)):
+                    stack.append((
+                        self._iter_entries(value),
+                        child_cursors if isinstance(value, dict) else ()
+                    ))
+                    descended = True
+                    break
+
+                if key is not None and value is not None:
+                    # Strategy 3: pattern recognition; the master
+                    # alternation answers "does any field's format match"
+                    # in one call, and only an actual hit pays for
+                    # checking the remaining fields
+                    value_str = value.strip() if isinstance(value, str) else str(value).strip()
+                    match = self._any_field_pattern.match(value_str)
+                    if match:
+                        matched_field = match.lastgroup
+                        if matched_field not in pattern_hits and matched_field not in resolved:
+                            pattern_hits[matched_field] = value_str
+                        for field, pattern in self._field_pattern.items():
+                            if field == matched_field or field in pattern_hits or field in resolved:
+                                continue
+                            if pattern.match(value_str):
+                                pattern_hits[field] = value_str
+
+            if not descended:
+                stack.pop()
+
+        # Resolve path vs fuzzy vs pattern results per field, mirroring
+        # the old per-field strategy ordering and thresholds
+        results: Dict[str, Tuple[Optional[str], float]] = {}
+        for field in fields:
+            hit = path_hits.get(field)
+            if hit is not None:
+                results[field] = (hit[1], 0.95)  # High confidence for known paths
+                continue
+
+            value, confidence = best[field]
+            if value and confidence > 0.7:
+                results[field] = (value, confidence)
+                continue
+
+            pattern_value = pattern_hits.get(field)
+            if pattern_value:
+                # Pattern matches carry moderate, fixed confidence
+                if confidence > 0.65:
+                    results[field] = (value, confidence)
+                else:
+                    results[field] = (pattern_value, 0.65)
+                continue
 
-        # Return best result found (if any)
-        if value:
-            return value, confidence
+            results[field] = (value, confidence)
 
-        return None, 0.0
+        return results
 
-    def _get_nested_value(self, data: Any, path: List[str]) -> Optional[Any]:
-        """
-        Get value from nested dictionary using path.
+    @staticmethod
+    def _normalize_key(key: Any) -> str:
+        """Normalize a field name for matching (lowercase, no separators)."""
+        return _normalize(key if isinstance(key, str) else str(key))
 
-        Args:
-            data: Dictionary or nested structure
-            path: List of keys representing the path
+    def _build_path_trie(self) -> Dict[str, Any]:
+        """
+        Flatten common_paths into one trie of lower-cased path components.
 
-        Returns:
-            Value if found, None otherwise
+        Leaves carry '$' entries of (field, priority) where priority is
+        the path's position in the field's list, preserving the original
+        first-path-wins preference.
         """
-        current = data
+        root: Dict[str, Any] = {}
 
-        for key in path:
-            if isinstance(current, dict):
-                # Try exact key match
-                if key in current:
-                    current = current[key]
-                else:
-                    # Try case-insensitive match
-                    for dict_key in current.keys():
-                        if isinstance(dict_key, str) and dict_key.lower() == key.lower():
-                            current = current[dict_key]
-                            break
-                    else:
-                        return None
-            else:
-                return None
+        for field, paths in self.common_paths.items():
+            for priority, path in enumerate(paths):
+                node = root
+                for key in path:
+                    node = node.setdefault(key.lower(), {})
+                node.setdefault('$', []).append((field, priority))
 
-        return current
+        return root
 
-    def _fuzzy_field_search(
-        self,
-        json_data: Dict[str, Any],
-        target_field: str
-    ) -> Tuple[Optional[str], float]:
+    def _build_variation_trie(self) -> Dict[str, Any]:
         """
-        Search for field using fuzzy name matching at any nesting level.
+        Build a character trie over all normalized field-name variations.
 
-        Args:
-            json_data: The JSON data
-            target_field: The field we're looking for
-
-        Returns:
-            Tuple of (value, confidence_score)
+        Each node maps characters to child nodes; the '#' entry records,
+        per owning field, the length of the shortest full variation that
+        passes through the node, which is what the prefix-based scoring
+        needs.
         """
-        variations = self.field_variations.get(target_field, [target_field])
-        best_value = None
-        best_confidence = 0.0
+        root: Dict[str, Any] = {}
 
-        def search_recursive(obj: Any, path: str = '') -> None:
-            nonlocal best_value, best_confidence
+        for field, variations in self.field_variations.items():
+            for variation in variations:
+                normalized = self._normalize_key(variation)
+                node = root
+                for char in normalized:
+                    node = node.setdefault(char, {})
+                    lengths = node.setdefault('#', {})
+                    if field not in lengths or len(normalized) < lengths[field]:
+                        lengths[field] = len(normalized)
 
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
+        return root
 
-                    # Check if this key matches any variation
-                    confidence = self._calculate_field_match_confidence(
-                        key,
-                        variations
-                    )
+    def _trie_field_scores(self, normalized_key: str) -> Dict[str, float]:
+        """
+        Score a normalized dict key against every field in one trie descent.
 
-                    if confidence > best_confidence and value is not None:
-                        # Validate the value makes sense for this field type
-                        if self._validate_value_for_field(target_field, value):
-                            best_value = str(value)
-                            best_confidence = confidence
+        Confidence is common-prefix-length / max(key length, variation
+        length), so an exact variation match scores 1.0 and unrelated keys
+        fall away quickly.
 
-                    # Recurse into nested structures
-                    if isinstance(value, (dict, list)):
-                        search_recursive(value, current_path)
+        Returns:
+            Mapping of field name to match confidence (missing = 0.0)
+        """
+        node = self._variation_trie
+        key_len = len(normalized_key)
+        depth = 0
 
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    search_recursive(item, f"{path}[{i}]")
+        for char in normalized_key:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            depth += 1
 
-        search_recursive(json_data)
-        return best_value, best_confidence
+        if depth == 0:
+            return {}
 
-    def _calculate_field_match_confidence(
-        self,
-        key: str,
-        variations: List[str]
-    ) -> float:
-        """
-        Calculate confidence that a field name matches what we're looking for.
+        lengths = node.get('#')
+        if not lengths:
+            return {}
 
-        Uses fuzzy string matching (Levenshtein distance).
-        """
-        key_lower = str(key).lower().replace('_', '').replace('-', '').replace(' ', '')
+        return {
+            field: depth / max(key_len, variation_len)
+            for field, variation_len in lengths.items()
+        }
 
-        best_ratio = 0.0
-        for variation in variations:
-            var_lower = variation.lower().replace('_', '').replace('-', '').replace(' ', '')
-            ratio = SequenceMatcher(None, key_lower, var_lower).ratio()
-            best_ratio = max(best_ratio, ratio)
+    @staticmethod
+    def _iter_entries(obj: Any):
+        """Yield (key, value) pairs for a container; list items carry no key."""
+        if isinstance(obj, dict):
+            return iter(obj.items())
+        return ((None, item) for item in obj)
 
-        return best_ratio
+    def _key_field_scores(self, normalized_key: str) -> Dict[str, float]:
+        """
+        Score a normalized dict key against every field.
 
-    def _validate_value_for_field(self, field_name: str, value: Any) -> bool:
+        The trie descent handles the common cases; when it finds nothing
+        convincing and RapidFuzz is installed, one C-level extractOne call
+        over the normalized variations recovers fuzzy matches (typos,
+        rearranged words) that share no prefix with any variation.
+        """
+        scores = self._trie_field_scores(normalized_key)
+
+        if HAS_RAPIDFUZZ and (not scores or max(scores.values()) <= 0.7):
+            match = process.extractOne(
+                normalized_key,
+                self._variations_normalized,
+                scorer=fuzz.ratio,
+                score_cutoff=70
+            )
+            if match:
+                variation, score, _ = match
+                field = self._variation_owner[variation]
+                ratio = score / 100.0
+                if ratio > scores.get(field, 0.0):
+                    scores = dict(scores)
+                    scores[field] = ratio
+
+        elif HAS_NUMBA and (not scores or max(scores.values()) <= 0.7):
+            key_bytes = np.frombuffer(
+                normalized_key.encode('ascii', 'ignore'), dtype=np.uint8
+            )
+            if key_bytes.size:
+                idx, ratio = _best_ratio(
+                    key_bytes, self._variation_matrix, self._variation_lens
+                )
+                if idx >= 0 and ratio >= 0.7:
+                    field = self._variation_owner[self._variations_normalized[idx]]
+                    if ratio > scores.get(field, 0.0):
+                        scores = dict(scores)
+                        scores[field] = ratio
+
+        return scores
+
+    def _validate_value_for_field(self, field_name: str, value: Any,
+                                  value_str: Optional[str] = None) -> bool:
         """
         Validate that a value makes sense for a given field.
 
         Args:
             field_name: The field type
             value: The value to validate
+            value_str: Optional pre-stripped string form of the value, so
+                callers validating the same value against several fields
+                only stringify it once
 
         Returns:
             True if value is valid for this field type
@@ -325,18 +584,18 @@ class IntelligentExtractor:
         if value is None or value == '':
             return False
 
-        value_str = str(value).strip()
+        if value_str is None:
+            value_str = str(value).strip()
 
         # Check against known patterns for this field
-        if field_name in self.value_patterns:
-            for pattern in self.value_patterns[field_name]:
-                if re.match(pattern, value_str, re.IGNORECASE):
-                    return True
+        field_pattern = self._field_pattern.get(field_name)
+        if field_pattern is not None and field_pattern.match(value_str):
+            return True
 
         # Additional semantic validation
         if field_name == 'loan_amount':
             try:
-                amount = float(str(value).replace(',', '').replace('$', ''))
+                amount = float(value_str.replace(',', '').replace('$', ''))
                 # Reasonable loan amount: $1,000 to $100,000,000
                 return 1000 <= amount <= 100000000
             except (ValueError, TypeError):
@@ -344,7 +603,7 @@ class IntelligentExtractor:
 
         elif field_name == 'interest_rate':
             try:
-                rate = float(str(value).replace('%', ''))
+                rate = float(value_str.replace('%', ''))
                 # Reasonable interest rate: 0% to 50%
                 return 0 <= rate <= 50
             except (ValueError, TypeError):
@@ -353,7 +612,7 @@ class IntelligentExtractor:
         elif field_name == 'loan_term':
             try:
                 # Extract numeric part
-                term_str = re.search(r'\d+', str(value))
+                term_str = self._digits_re.search(value_str)
                 if term_str:
                     term = int(term_str.group())
                     # Reasonable term: 1 to 360 months (30 years)
@@ -363,52 +622,11 @@ class IntelligentExtractor:
 
         elif field_name == 'borrower_name':
             # Should be alphabetic with possible spaces, hyphens, apostrophes
-            return bool(re.match(r"^[A-Za-z\s\-'.]+$", value_str)) and len(value_str) >= 2
+            return bool(self._name_re.match(value_str)) and len(value_str) >= 2
 
         # Default: allow any non-empty string
         return len(value_str) > 0
 
-    def _pattern_based_search(
-        self,
-        json_data: Dict[str, Any],
-        target_field: str
-    ) -> Tuple[Optional[str], float]:
-        """
-        Search for values that match expected patterns for this field type.
-
-        This is useful when field names don't match but values do.
-        """
-        if target_field not in self.value_patterns:
-            return None, 0.0
-
-        patterns = self.value_patterns[target_field]
-        candidates = []
-
-        def search_values(obj: Any) -> None:
-            if isinstance(obj, dict):
-                for value in obj.values():
-                    if isinstance(value, (dict, list)):
-                        search_values(value)
-                    elif value is not None:
-                        value_str = str(value).strip()
-                        # Check if value matches any pattern
-                        for pattern in patterns:
-                            if re.match(pattern, value_str, re.IGNORECASE):
-                                candidates.append(value_str)
-                                break
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_values(item)
-
-        search_values(json_data)
-
-        if candidates:
-            # Return first match with moderate confidence
-            # (lower than field name matching)
-            return candidates[0], 0.65
-
-        return None, 0.0
-
     def _calculate_overall_confidence(
         self,
         confidence_scores: Dict[str, float]
@@ -433,29 +651,37 @@ class IntelligentExtractor:
         """
         address_parts = []
 
-        # Try to find address components
-        def search_address_parts(obj: Any, path: str = '') -> None:
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    key_lower = str(key).lower()
-
-                    if 'street' in key_lower or 'address' in key_lower:
-                        if isinstance(value, str) and value not in address_parts:
-                            address_parts.append(value)
-                    elif 'city' in key_lower:
-                        if isinstance(value, str) and value not in address_parts:
-                            address_parts.append(value)
-                    elif 'state' in key_lower:
-                        if isinstance(value, str) and value not in address_parts:
-                            address_parts.append(value)
-                    elif 'zip' in key_lower or 'postal' in key_lower:
-                        if isinstance(value, str) and value not in address_parts:
-                            address_parts.append(value)
-
-                    if isinstance(value, dict):
-                        search_address_parts(value, f"{path}.{key}")
-
-        search_address_parts(json_data)
+        # Find address components iteratively, preserving the preorder the
+        # recursive version produced (part ordering matters for the join)
+        stack = [iter(json_data.items())] if isinstance(json_data, dict) else []
+
+        while stack:
+            frame = stack[-1]
+            descended = False
+
+            for key, value in frame:
+                key_lower = _lower(key if isinstance(key, str) else str(key))
+
+                if 'street' in key_lower or 'address' in key_lower:
+                    if isinstance(value, str) and value not in address_parts:
+                        address_parts.append(value)
+                elif 'city' in key_lower:
+                    if isinstance(value, str) and value not in address_parts:
+                        address_parts.append(value)
+                elif 'state' in key_lower:
+                    if isinstance(value, str) and value not in address_parts:
+                        address_parts.append(value)
+                elif 'zip' in key_lower or 'postal' in key_lower:
+                    if isinstance(value, str) and value not in address_parts:
+                        address_parts.append(value)
+
+                if isinstance(value, dict):
+                    stack.append(iter(value.items()))
+                    descended = True
+                    break
+
+            if not descended:
+                stack.pop()
 
         if address_parts:
             return ', '.join(address_parts)
@@ -8,9 +8,10 @@ CRUD operations, context manager usage, error handling, and performance testing.
 
 import sys
 import os
+import tempfile
 from pathlib import Path
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -287,6 +288,103 @@ def test_performance():
     print("\n✅ Performance test completed!")
 
 
+def test_event_streaming():
+    """Test event streaming and time-bounded event queries."""
+    print("\n📡 EVENT STREAMING TEST")
+    print("=" * 60)
+
+    # A throwaway SQLite file keeps this test self-contained and
+    # deterministic (the engine's pool options reject :memory:)
+    db_path = os.path.join(tempfile.gettempdir(), f"test_event_streaming_{os.getpid()}.db")
+    with Database(f"sqlite:///{db_path}") as db:
+        artifact_id = db.insert_artifact(
+            loan_id="LOAN_2024_STREAM_001",
+            artifact_type="loan_packet",
+            etid=100001,  # ETID for loan packets
+            payload_sha256="57" * 32,
+            walacor_tx_id="WAL_TX_STREAM_001",
+            created_by="stream_test@integrityx.com"
+        )
+
+        # Create 25 events and pin their timestamps one minute apart so the
+        # time-bound assertions are deterministic
+        base_time = datetime(2024, 1, 1, 12, 0, 0)
+        event_ids = []
+        for i in range(25):
+            event_id = db.insert_event(
+                artifact_id=artifact_id,
+                event_type="uploaded" if i % 2 == 0 else "verified",
+                created_by="stream_test@integrityx.com",
+                payload_json=f'{{"sequence": {i}}}'
+            )
+            event_ids.append(event_id)
+        session = db._ensure_session()
+        for i, event_id in enumerate(event_ids):
+            session.query(ArtifactEvent).filter(ArtifactEvent.id == event_id)\
+                .update({'created_at': base_time + timedelta(minutes=i)})
+        session.commit()
+        print(f"✅ Created {len(event_ids)} events with pinned timestamps")
+
+        # Test 1: Streaming returns every event in creation order
+        print("\n1️⃣ Streaming All Events (batch_size=10):")
+        streamed = list(db.iter_artifact_events(artifact_id, batch_size=10))
+        assert len(streamed) == 25, f"Expected 25 events, got {len(streamed)}"
+        assert [e.id for e in streamed] == event_ids, "Events out of creation order"
+        print(f"✅ Streamed {len(streamed)} events in creation order")
+
+        # Test 2: Streaming matches the list-based query
+        print("\n2️⃣ Streaming vs. get_artifact_events:")
+        listed = db.get_artifact_events(artifact_id)
+        assert [e.id for e in streamed] == [e.id for e in listed]
+        print("✅ iter_artifact_events matches get_artifact_events")
+
+        # Test 3: Inclusive start/end bounds
+        print("\n3️⃣ Time-Bounded Queries:")
+        start = base_time + timedelta(minutes=5)
+        end = base_time + timedelta(minutes=9)
+        bounded = db.get_artifact_events(artifact_id, start_time=start, end_time=end)
+        assert [e.id for e in bounded] == event_ids[5:10], "Bounds are not inclusive"
+        print(f"✅ Both bounds: {len(bounded)} events (minutes 5-9, inclusive)")
+
+        from_start = db.get_artifact_events(artifact_id, start_time=start)
+        assert [e.id for e in from_start] == event_ids[5:]
+        print(f"✅ Start bound only: {len(from_start)} events")
+
+        until_end = db.get_artifact_events(artifact_id, end_time=end)
+        assert [e.id for e in until_end] == event_ids[:10]
+        print(f"✅ End bound only: {len(until_end)} events")
+
+        bounded_stream = list(db.iter_artifact_events(
+            artifact_id, start_time=start, end_time=end, batch_size=3
+        ))
+        assert [e.id for e in bounded_stream] == event_ids[5:10]
+        print(f"✅ Bounded streaming: {len(bounded_stream)} events")
+
+        # Test 4: Empty artifact_id is rejected
+        print("\n4️⃣ Empty artifact_id Validation:")
+        try:
+            db.get_artifact_events("")
+            print("❌ get_artifact_events should have failed with empty artifact_id")
+        except ValueError as e:
+            print(f"✅ get_artifact_events correctly caught error: {e}")
+        try:
+            list(db.iter_artifact_events(""))
+            print("❌ iter_artifact_events should have failed with empty artifact_id")
+        except ValueError as e:
+            print(f"✅ iter_artifact_events correctly caught error: {e}")
+
+        # Test 5: Unknown artifact streams nothing
+        print("\n5️⃣ Unknown Artifact:")
+        empty = list(db.iter_artifact_events("non-existent-id"))
+        assert empty == []
+        print("✅ Streaming an unknown artifact yields no events")
+
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    print("\n✅ Event streaming tests completed!")
+
+
 def test_context_manager():
     """Test context manager functionality."""
     print("\n🔄 CONTEXT MANAGER TEST")
@@ -343,6 +441,7 @@ def main():
         test_basic_operations()
         test_error_handling()
         test_performance()
+        test_event_streaming()
         test_context_manager()
         
         print("\n" + "=" * 80)